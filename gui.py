@@ -1,25 +1,45 @@
 from __future__ import annotations
 
+import functools
 import sys
 import time
-from typing import Optional, Dict, Set, Callable, List
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional, Dict, Callable, Iterator, List, Tuple
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QTimer, Signal, QObject, QDateTime, QEvent, QRunnable, QThreadPool
-from PySide6.QtGui import QIcon, QColor, QPixmap, QGuiApplication
+from PySide6.QtCore import (
+    Qt, QTimer, Signal, QObject, QEvent, QRunnable, QThreadPool, QSignalBlocker,
+    QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QSize
+)
+from PySide6.QtGui import QIcon, QBrush, QColor, QPixmap, QGuiApplication
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QPushButton, QLabel, QHBoxLayout,
     QComboBox, QGroupBox, QFormLayout, QStatusBar, QMessageBox, QCheckBox,
-    QTreeWidget, QTreeWidgetItem, QStyle, QSplitter, QSizePolicy, QSystemTrayIcon, QMenu,
+    QTreeView, QStyle, QSplitter, QSizePolicy, QSystemTrayIcon, QMenu,
     QToolButton, QHeaderView, QLayout
 )
 
-from tailscale_client import TailscaleClient, TailscaleError, tailscale_available, Device, Status
-from ip_info import PublicIPFetcher
+from tailscale_client import TailscaleClient, TailscaleError, Device, Status
+
+if TYPE_CHECKING:
+    from ip_info import PublicIPFetcher
 
 
 ICON_FILENAMES = ("assets_icon_tailui.png", "assets_icon_tailui.svg")
 
+# Warianty BackendState oznaczające działający backend (porównanie bez .lower() co iterację)
+_RUNNING_STATES = frozenset({"Running", "running", "RUNNING"})
+
+# Zdarzenia oznaczające aktywność użytkownika (przyspieszone odświeżenie)
+# (bez Wheel - każdy krok przewijania wywoływałby eventFilter i planował odświeżenie;
+# lista nie jest już przebudowywana, więc pozycja przewijania nie jest zagrożona)
+_WATCHED_EVENTS = frozenset({QEvent.MouseButtonPress, QEvent.KeyPress, QEvent.FocusIn})
+
+# Pędzle wierszy listy urządzeń (tworzone raz, współdzielone przez wszystkie komórki);
+# QBrush zamiast QColor - widok nie musi konwertować koloru przy każdym rysowaniu
+_GREY = QBrush(QColor('#888888'))
+_EXIT_YELLOW = QBrush(QColor('#ffd479'))
+
 
 def _resolve_app_icon_path() -> Optional[Path]:
     base_dir = Path(__file__).parent
@@ -30,7 +50,9 @@ def _resolve_app_icon_path() -> Optional[Path]:
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def _load_app_icon() -> Optional[QIcon]:
+    # Ikona wczytywana raz i współdzielona przez aplikację, okno i zasobnik
     icon_path = _resolve_app_icon_path()
     if not icon_path:
         return None
@@ -38,6 +60,176 @@ def _load_app_icon() -> Optional[QIcon]:
     return icon if not icon.isNull() else None
 
 
+@functools.lru_cache(maxsize=4)
+def _app_icon_pixmap(size: int) -> Optional[QPixmap]:
+    # Przeskalowana ikona aplikacji dla danego rozmiaru - SVG dekodowany tylko raz
+    app_icon = _load_app_icon()
+    if not app_icon:
+        return None
+    pm = app_icon.pixmap(size, size)
+    if pm.isNull():
+        icon_path = _resolve_app_icon_path()
+        if icon_path:
+            pm = QPixmap(str(icon_path))
+    if pm.isNull():
+        return None
+    return pm.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+_std_icons_cache: Dict[QStyle.StandardPixmap, QIcon] = {}
+
+
+def _std_icon(style: QStyle, key: QStyle.StandardPixmap) -> QIcon:
+    # Aplikacja używa jednego stylu, więc ikony standardowe wystarczy pobrać raz
+    icon = _std_icons_cache.get(key)
+    if icon is None:
+        icon = style.standardIcon(key)
+        _std_icons_cache[key] = icon
+    return icon
+
+
+# Arkusz stylów trzymany w module (a nie w osobnym pliku), aby działał też w binarce PyInstaller
+_STYLESHEET = """
+QMainWindow {
+    background-color: #2b2d30;
+}
+QLabel {
+    color: #c9d1d9;
+}
+QLabel#AppTitle {
+    font-size: 20px;
+    font-weight: bold;
+    color: #8ab4f8;
+}
+QLabel#LastRefresh {
+    color: #8b949e;
+    font-size: 11px;
+}
+QGroupBox {
+    background-color: #313335;
+    border: 1px solid #454749;
+    border-radius: 8px;
+    margin-top: 1ex;
+    font-weight: bold;
+    color: #9db1c5;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    subcontrol-position: top left;
+    padding: 0 10px;
+    background-color: #3c3f41;
+    border-radius: 4px;
+    color: #c9d1d9;
+    left: 10px;
+}
+QPushButton {
+    background-color: #4c5052;
+    color: #dfe1e5;
+    border: none;
+    padding: 8px 16px;
+    border-radius: 6px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #5a6164;
+    color: #ffffff;
+}
+QPushButton:pressed {
+    background-color: #3d4043;
+}
+QPushButton:disabled {
+    background-color: #3c3f41;
+    color: #6e7681;
+}
+
+QToolButton#AddressCopyButton {
+    background-color: #4c5052;
+    color: #dfe1e5;
+    border: none;
+    padding: 4px 10px;
+    border-radius: 4px;
+    font-weight: bold;
+}
+QToolButton#AddressCopyButton:hover {
+    background-color: #5a6164;
+    color: #ffffff;
+}
+QToolButton#AddressCopyButton:pressed {
+    background-color: #3d4043;
+}
+QToolButton#AddressCopyButton:disabled {
+    background-color: #3c3f41;
+    color: #6e7681;
+}
+
+QPushButton#ToggleButton[connected="true"] {
+    background-color: #d73a49;
+    color: #ffffff;
+}
+QPushButton#ToggleButton[connected="true"]:hover {
+    background-color: #e5505e;
+}
+QPushButton#ToggleButton[connected="false"] {
+    background-color: #28a745;
+    color: #ffffff;
+}
+QPushButton#ToggleButton[connected="false"]:hover {
+    background-color: #34c759;
+}
+QTreeView {
+    background-color: #313335;
+    border: 1px solid #454749;
+    border-radius: 6px;
+    color: #c9d1d9;
+}
+QTreeView::item {
+    padding: 4px 2px;
+}
+QTreeView::item:selected {
+    background-color: #3e4447;
+    color: #ffffff;
+}
+QTreeView::item:hover {
+    background-color: #383b3d;
+}
+QHeaderView::section {
+    background-color: #3c3f41;
+    color: #8ab4f8;
+    padding: 6px;
+    border: 1px solid #454749;
+    font-weight: bold;
+}
+QComboBox {
+    background-color: #313335;
+    border: 1px solid #454749;
+    border-radius: 4px;
+    padding: 4px;
+    color: #c9d1d9;
+}
+QComboBox:hover {
+    border: 1px solid #5a6164;
+}
+QComboBox:disabled {
+    color: #6e7681;
+}
+QComboBox::drop-down {
+    border: none;
+}
+QCheckBox {
+    color: #c9d1d9;
+}
+QStatusBar {
+    background-color: #282829;
+    color: #c9d1d9;
+}
+QSplitter::handle {
+    background-color: #454749;
+}
+"""
+# Zbędne białe znaki usuwane raz przy imporcie - mniej pracy dla tokenizera QSS
+_STYLESHEET = " ".join(_STYLESHEET.split())
+
+
 class WorkerSignals(QObject):
     error = Signal(str)
     finished = Signal(object)
@@ -63,12 +255,225 @@ class Worker(QRunnable):
             self.signals.finished.emit(result)
 
 
+@dataclass
+class _DeviceRow:
+    key: str
+    texts: Tuple[str, ...]
+    ipv4: List[str] = field(default_factory=list)
+    ipv6: List[str] = field(default_factory=list)
+    addresses: str = "-"
+    online: bool = True
+    is_exit_node: bool = False
+
+    @classmethod
+    def from_device(cls, d: Device) -> "_DeviceRow":
+        status_text = "online" if d.online else "offline"
+        exit_text = "tak" if d.is_exit_node else ("możliwy" if d.exit_node_option else "-")
+        # Jedno przejście po adresach: podział na IPv4/IPv6 i tekst kolumny z tej samej listy
+        ips = [ip.strip() for ip in d.tailnet_ips or () if ip and ip.strip()]
+        ipv4_list = [ip for ip in ips if ":" not in ip]
+        ipv6_list = [ip for ip in ips if ":" in ip]
+        addresses_text = ", ".join(ips) if ips else "-"
+        return cls(
+            key=str(d.device_id or d.name),
+            texts=(d.name, "", status_text, exit_text, d.os or "-"),
+            ipv4=ipv4_list,
+            ipv6=ipv6_list,
+            addresses=addresses_text,
+            online=d.online,
+            is_exit_node=d.is_exit_node,
+        )
+
+
+class DevicesModel(QAbstractTableModel):
+    """Płaska lista urządzeń Tailnet dla QTreeView.
+
+    Odświeżenie porównuje nowe dane z bieżącymi wierszami (po identyfikatorze
+    urządzenia) i emituje tylko potrzebne sygnały wstawienia/usunięcia/zmiany.
+    """
+
+    HEADERS = ("Nazwa", "Adresy", "Status", "Exit", "System")
+    ADDRESSES_COLUMN = 1
+    EXIT_COLUMN = 3
+    IPV4_ROLE = Qt.UserRole + 1
+    IPV6_ROLE = Qt.UserRole + 2
+    ADDR_TEXT_ROLE = Qt.UserRole + 3
+    _CHANGED_ROLES = [Qt.DisplayRole, Qt.ForegroundRole, IPV4_ROLE, IPV6_ROLE, ADDR_TEXT_ROLE]
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._rows: List[_DeviceRow] = []
+        self._size_hints: Dict[str, QSize] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            return row.texts[column]
+        if role == Qt.ForegroundRole:
+            if column == self.EXIT_COLUMN and row.is_exit_node:
+                return _EXIT_YELLOW
+            return None if row.online else _GREY
+        if column != self.ADDRESSES_COLUMN:
+            return None
+        if role == Qt.SizeHintRole:
+            return self._size_hints.get(row.key)
+        if role == self.IPV4_ROLE:
+            return row.ipv4
+        if role == self.IPV6_ROLE:
+            return row.ipv6
+        if role == self.ADDR_TEXT_ROLE:
+            return row.addresses
+        return None
+
+    def set_devices(self, devices: List[Device]) -> Tuple[List[int], bool]:
+        """Aktualizuje wiersze i zwraca (wiersze ze zmienionymi adresami, czy zmieniła się liczba wierszy)."""
+        new_rows: Dict[str, _DeviceRow] = {}
+        for d in devices:
+            row = _DeviceRow.from_device(d)
+            new_rows.setdefault(row.key, row)
+
+        rows_changed = False
+        for pos in range(len(self._rows) - 1, -1, -1):
+            key = self._rows[pos].key
+            if key not in new_rows:
+                self.beginRemoveRows(QModelIndex(), pos, pos)
+                del self._rows[pos]
+                self._size_hints.pop(key, None)
+                self.endRemoveRows()
+                rows_changed = True
+
+        address_rows: List[int] = []
+        last_column = len(self.HEADERS) - 1
+        for pos, current in enumerate(self._rows):
+            row = new_rows.pop(current.key)
+            if row == current:
+                continue
+            if row.addresses != current.addresses:
+                address_rows.append(pos)
+            self._rows[pos] = row
+            first_col, last_col = self._changed_columns(current, row, last_column)
+            self.dataChanged.emit(self.index(pos, first_col), self.index(pos, last_col), self._CHANGED_ROLES)
+
+        if new_rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+            self._rows.extend(new_rows.values())
+            self.endInsertRows()
+            address_rows.extend(range(first, len(self._rows)))
+            rows_changed = True
+
+        return address_rows, rows_changed
+
+    @classmethod
+    def _changed_columns(cls, old: _DeviceRow, new: _DeviceRow, last_column: int) -> Tuple[int, int]:
+        # Zmiana koloru (online / exit node) dotyczy całego wiersza
+        if old.online != new.online or old.is_exit_node != new.is_exit_node:
+            return 0, last_column
+        changed = [col for col, (a, b) in enumerate(zip(old.texts, new.texts)) if a != b]
+        # Kolumna adresów ma pusty tekst - jej zmianę widać tylko w rolach adresów
+        if (old.ipv4, old.ipv6, old.addresses) != (new.ipv4, new.ipv6, new.addresses):
+            changed.append(cls.ADDRESSES_COLUMN)
+            changed.sort()
+        if not changed:
+            return 0, last_column
+        return changed[0], changed[-1]
+
+    def set_size_hint(self, row: int, size: QSize):
+        key = self._rows[row].key
+        if self._size_hints.get(key) == size:
+            return
+        self._size_hints[key] = size
+        index = self.index(row, self.ADDRESSES_COLUMN)
+        self.dataChanged.emit(index, index, [Qt.SizeHintRole])
+
+
+_UNSET = object()
+
+
+class StatusCache(QObject):
+    """Porównuje kolejne statusy i emituje sygnały tylko dla zmienionych fragmentów."""
+
+    connectedChanged = Signal(object)   # Status
+    devicesChanged = Signal(object)     # Status
+    selfIpsChanged = Signal(object)     # Optional[Device]
+    exitNodesChanged = Signal(object)   # Status
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.invalidate()
+
+    def invalidate(self):
+        # Kolejna aktualizacja wyemituje wszystkie sygnały (None jest poprawnym kluczem
+        # statusu bez własnego urządzenia, więc znacznikiem jest osobny obiekt)
+        self._connected_key = _UNSET
+        self._devices_key = _UNSET
+        self._self_ips_key = _UNSET
+        self._exit_nodes_key = _UNSET
+
+    def update(self, st: Status):
+        connected_key = (st.backend_state, st.connected)
+        if connected_key != self._connected_key:
+            self._connected_key = connected_key
+            self.connectedChanged.emit(st)
+
+        devices_key = tuple(
+            (d.device_id, d.name, d.online, d.is_exit_node, d.exit_node_option, tuple(d.tailnet_ips), d.os)
+            for d in st.devices
+        )
+        if devices_key != self._devices_key:
+            self._devices_key = devices_key
+            self.devicesChanged.emit(st)
+
+        self_ips_key = tuple(st.self_device.tailnet_ips) if st.self_device else None
+        if self_ips_key != self._self_ips_key:
+            self._self_ips_key = self_ips_key
+            self.selfIpsChanged.emit(st.self_device)
+
+        exit_nodes_key = (
+            tuple(
+                (d.device_id, d.name, tuple(d.tailnet_ips),
+                 (d.hostinfo or {}).get("Hostname"), (d.hostinfo or {}).get("DNSName"))
+                for d in st.exit_nodes
+            ),
+            st.active_exit_node.device_id if st.active_exit_node else None,
+        )
+        if exit_nodes_key != self._exit_nodes_key:
+            self._exit_nodes_key = exit_nodes_key
+            self.exitNodesChanged.emit(st)
+
+
 class MainWindow(QMainWindow):
+    # Każde odświeżenie to osobny proces `tailscale status` i wybudzenie CPU; przy stabilnym
+    # połączeniu i niezmiennej liście urządzeń zwalniamy od 15 s, podwajając do 60 s, kosztem
+    # wolniejszego zauważenia zmian z innych urządzeń (interakcja użytkownika od razu przywraca 5 s)
     REFRESH_MS = 5000
+    REFRESH_CHANGED_MS = 2000   # szybka kontrola tuż po zmianie stanu
+    REFRESH_STEADY_MS = 15000   # połączenie stabilne od kilku odświeżeń
+    STEADY_POLLS = 3
+    REFRESH_IDLE_MAX_MS = 60000
     INTERACTION_DEBOUNCE_MS = 350  # krótka zwłoka po interakcji
-    DEVICE_IPV4_ROLE = Qt.UserRole + 1
-    DEVICE_IPV6_ROLE = Qt.UserRole + 2
-    DEVICE_ADDR_TEXT_ROLE = Qt.UserRole + 3
+    IP_FETCH_DEBOUNCE_MS = 200
+    # Wynik `tailscale status` młodszy niż TTL jest uznawany za aktualny
+    STATUS_TTL_SEC = 0.8
+    # Minimalny odstęp między wymuszonymi odświeżeniami (seria kliknięć/operacji = jedno wywołanie)
+    FORCED_REFRESH_MIN_GAP_SEC = 0.25
+    DEVICE_IPV4_ROLE = DevicesModel.IPV4_ROLE
+    DEVICE_IPV6_ROLE = DevicesModel.IPV6_ROLE
+    DEVICE_ADDR_TEXT_ROLE = DevicesModel.ADDR_TEXT_ROLE
 
     def __init__(self):
         super().__init__()
@@ -76,11 +481,14 @@ class MainWindow(QMainWindow):
         self.resize(1100, 900)
 
         self.client: Optional[TailscaleClient] = None
-        self.ip_fetcher = PublicIPFetcher(ttl=180)
-        self._last_refresh_ts: Optional[float] = None
+        self._ip_fetcher: Optional[PublicIPFetcher] = None
+        self._last_refresh_ts: Optional[float] = None  # czas ścienny - do wyświetlenia
+        self._last_refresh_mono: Optional[float] = None  # zegar monotoniczny - do TTL i debounce
+        self._last_refresh_display = ""
         self._busy_toggle = False  # blokada wielokrotnego przełączania
         self._exit_entries: Dict[str, str] = {}
         self._exit_alias_map: Dict[str, str] = {}
+        self._exit_nodes_sig: tuple = ()
         self._exit_active_value: Optional[str] = None
         self._exit_has_nodes = False
         self._exit_busy = False
@@ -98,74 +506,127 @@ class MainWindow(QMainWindow):
         self._self_ipv4_list: List[str] = []
         self._self_ipv6_list: List[str] = []
         self._public_ip_pending = False
+        self._public_ip_refetch_queued = False
+        # Krótki debounce - seria wywołań (odświeżenie + zmiana łączności) daje jedno zapytanie
+        self._ip_fetch_timer = QTimer(self)
+        self._ip_fetch_timer.setSingleShot(True)
+        self._ip_fetch_timer.setTimerType(Qt.CoarseTimer)
+        self._ip_fetch_timer.timeout.connect(self._do_fetch_public_ip)
+        self._ip_fetch_force = False
+        self._last_rendered_public_ip: Optional[Tuple[str, str]] = None
         self._devices_layout_refresh_pending = False
-
-        # Timer interakcji (debounce)
-        self._interaction_timer = QTimer(self)
-        self._interaction_timer.setSingleShot(True)
-        self._interaction_timer.timeout.connect(self._interaction_refresh)
-
-        # Polling timer
-        self._poll_timer: Optional[QTimer] = None
+        self._devices_columns_sized = False
+        # Ostatni znany stan łączności - publiczne IP wymuszamy tylko przy jego zmianie
+        self._last_connected: Optional[bool] = None
+        self._last_exit_node: Optional[str] = None
+
+        # Jeden harmonogram odświeżania: okresowy (adaptacyjny) i po interakcji
+        # CoarseTimer: odświeżanie nie wymaga precyzji, system może grupować wybudzenia
+        self._next_refresh = QTimer(self)
+        self._next_refresh.setSingleShot(True)
+        self._next_refresh.setTimerType(Qt.CoarseTimer)
+        self._next_refresh.timeout.connect(self.refresh_status)
+        self._forced_refresh_throttle = QTimer(self)
+        self._forced_refresh_throttle.setSingleShot(True)
+        self._forced_refresh_throttle.timeout.connect(lambda: self.refresh_status(force=True))
+        self._last_state_key: Optional[tuple] = None
+        self._steady_polls = 0
+        # `tailscale status` wykonywany w tle - nie blokuje wątku GUI
+        self._status_in_flight = False
+        self._status_refresh_queued = False
+        self._hidden_status: Optional[Status] = None
+        # Ostatni poprawny status - przy błędzie pokazujemy go jako nieaktualny
+        self._last_good_status: Optional[Status] = None
+        self._status_cache = StatusCache(self)
+        self._status_cache.connectedChanged.connect(self._on_connected_changed)
+        self._status_cache.devicesChanged.connect(self._populate_devices)
+        self._status_cache.selfIpsChanged.connect(self._update_self_ips)
+        self._status_cache.exitNodesChanged.connect(self._refresh_exit_nodes)
+
+        # Polling timer (tworzony raz, tylko uruchamiany/zatrzymywany)
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setSingleShot(True)
+        self._poll_timer.setTimerType(Qt.CoarseTimer)
+        self._poll_timer.timeout.connect(self._poll_iteration)
         self._poll_target: Optional[bool] = None
+        self._poll_status_in_flight = False
         self._poll_started_at: float = 0.0
         self._poll_timeout_sec = 15.0
+        # Backoff odpytywania: szybko na początku przejścia, potem rzadziej
+        self._poll_initial_interval_ms = 300
+        self._poll_interval_cap_ms = 1200
+        self._poll_next_interval_ms = self._poll_initial_interval_ms
         self._disconnect_timeout_sec = 6.0  # krótszy timeout dla rozłączania
         self._disconnect_grace_sec = 1.5    # po tym czasie uznaj rozłączenie jeśli brak błędów
         self._down_started_at: float = 0.0
 
+        # Równolegle działają najwyżej pobranie publicznego IP i jedna operacja tailscale -
+        # domyślne idealThreadCount() wątków byłoby marnotrawstwem
         self._thread_pool = QThreadPool(self)
-        self._active_workers = []
+        self._thread_pool.setMaxThreadCount(2)
+        # Osobna, jednowątkowa pula dla `tailscale status` - nigdy dwa wywołania naraz
+        self._status_pool = QThreadPool(self)
+        self._status_pool.setMaxThreadCount(1)
+        QApplication.instance().aboutToQuit.connect(self._shutdown_workers)
 
         self._init_client()
         self._build_ui()
         self._apply_styles()
         self._init_tray()
 
-        # Instalacja filtra zdarzeń, aby reagować na aktywność użytkownika
-        self.installEventFilter(self)
-
-        # Timer okresowy
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.refresh_status)
-        self.timer.start(self.REFRESH_MS)
-        self.refresh_status()
-        self.fetch_public_ip(force=True)
+        # Filtr zdarzeń tylko tam, gdzie świeży stan ma znaczenie przed akcją użytkownika;
+        # przyciski odświeżania i połączenia same wymuszają odświeżenie po kliknięciu
+        for widget in (
+            self.exit_enable_checkbox,
+            self.exit_node_combo,
+            self.devices_tree,
+            self.devices_tree.viewport(),
+        ):
+            widget.installEventFilter(self)
+
+        # Pierwsze odświeżenie statusu uruchamia showEvent - okno maluje się od razu.
+        # Publiczne IP pobieramy niezależnie od statusu (może się nie udać); debounce
+        # połączy to z wymuszonym pobraniem po pierwszym _apply_status
+        self.fetch_public_ip()
 
-    def _submit_worker(self, fn, on_success, on_error):
+    @property
+    def ip_fetcher(self) -> PublicIPFetcher:
+        # Tworzony przy pierwszym pobraniu (w wątku roboczym) - import `requests`
+        # nie opóźnia startu okna
+        if self._ip_fetcher is None:
+            from ip_info import PublicIPFetcher
+            self._ip_fetcher = PublicIPFetcher(ttl=180)
+        return self._ip_fetcher
+
+    def _submit_worker(self, fn, on_success, on_error, pool: Optional[QThreadPool] = None):
+        # Czasem życia Worker zarządza pula; obiekt sygnałów (dziecko okna) usuwamy po dostarczeniu wyniku
         worker = Worker(fn, parent=self)
-        self._active_workers.append(worker)
-
-        def _cleanup():
-            if worker in self._active_workers:
-                self._active_workers.remove(worker)
-
-        def _handle_success(result):
-            try:
-                on_success(result)
-            finally:
-                _cleanup()
-
-        def _handle_error(msg: str):
-            try:
-                on_error(msg)
-            finally:
-                _cleanup()
-
-        worker.signals.finished.connect(_handle_success)
-        worker.signals.error.connect(_handle_error)
-        self._thread_pool.start(worker)
+        signals = worker.signals
+        signals.finished.connect(on_success)
+        signals.error.connect(on_error)
+        signals.finished.connect(signals.deleteLater)
+        signals.error.connect(signals.deleteLater)
+        (pool or self._thread_pool).start(worker)
+
+    def _shutdown_workers(self):
+        # Przy wyjściu porzucamy zadania czekające w kolejce i dajemy chwilę trwającym
+        for timer in (self._next_refresh, self._forced_refresh_throttle, self._poll_timer, self._ip_fetch_timer):
+            timer.stop()
+        for pool in (self._status_pool, self._thread_pool):
+            pool.clear()
+        for pool in (self._status_pool, self._thread_pool):
+            pool.waitForDone(2000)
 
     # --- Inicjalizacja klienta ---
     def _init_client(self):
-        if tailscale_available():
-            try:
-                self.client = TailscaleClient()
-            except Exception as e:
-                self.client = None
-                print(f"Błąd inicjalizacji TailscaleClient: {e}")
-        else:
+        # TailscaleClient sam wyszukuje polecenie w PATH - bez drugiego przejścia przez tailscale_available()
+        try:
+            self.client = TailscaleClient()
+        except TailscaleError:
+            self.client = None
+        except Exception as e:
             self.client = None
+            print(f"Błąd inicjalizacji TailscaleClient: {e}")
 
     # --- Budowa UI ---
     def _build_ui(self):
@@ -177,18 +638,15 @@ class MainWindow(QMainWindow):
 
         top_bar = QHBoxLayout()
         top_bar.setSpacing(10)
+        style = self.style()
 
         app_icon = _load_app_icon()
         if app_icon:
             self.setWindowIcon(app_icon)
-            pm = app_icon.pixmap(32, 32)
-            if pm.isNull():
-                icon_path = _resolve_app_icon_path()
-                if icon_path:
-                    pm = QPixmap(str(icon_path))
-            if not pm.isNull():
+            pm = _app_icon_pixmap(32)
+            if pm is not None:
                 self.icon_label = QLabel()
-                self.icon_label.setPixmap(pm.scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+                self.icon_label.setPixmap(pm)
                 self.icon_label.setFixedSize(32, 32)
                 top_bar.addWidget(self.icon_label)
 
@@ -202,13 +660,13 @@ class MainWindow(QMainWindow):
         top_bar.addWidget(self.last_refresh_label)
 
         self.refresh_btn = QPushButton("Odśwież")
-        self.refresh_btn.setIcon(self.style().standardIcon(QStyle.SP_BrowserReload))
+        self.refresh_btn.setIcon(_std_icon(style, QStyle.SP_BrowserReload))
         self.refresh_btn.clicked.connect(self._manual_refresh)
         self.refresh_btn.setObjectName("RefreshButton")
         top_bar.addWidget(self.refresh_btn)
 
         self.toggle_button = QPushButton("Połącz")
-        self.toggle_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+        self.toggle_button.setIcon(_std_icon(style, QStyle.SP_MediaPlay))
         self.toggle_button.clicked.connect(self._handle_toggle_connection)
         self.toggle_button.setObjectName("ToggleButton")
         top_bar.addWidget(self.toggle_button)
@@ -242,9 +700,11 @@ class MainWindow(QMainWindow):
 
         devices_group = QGroupBox("Urządzenia w sieci")
         devices_layout = QVBoxLayout(devices_group)
-        self.devices_tree = QTreeWidget()
-        self.devices_tree.setColumnCount(5)
-        self.devices_tree.setHeaderLabels(["Nazwa", "Adresy", "Status", "Exit", "System"])
+        self.devices_model = DevicesModel(self)
+        self._devices_proxy = QSortFilterProxyModel(self)
+        self._devices_proxy.setSourceModel(self.devices_model)
+        self.devices_tree = QTreeView()
+        self.devices_tree.setModel(self._devices_proxy)
         self.devices_tree.setRootIsDecorated(False)
         self.devices_tree.setAlternatingRowColors(True)
         self.devices_tree.setSortingEnabled(True)
@@ -252,15 +712,17 @@ class MainWindow(QMainWindow):
         self.devices_tree.setUniformRowHeights(False)
         self.devices_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.devices_tree.customContextMenuRequested.connect(self._on_device_context_menu)
-        self.devices_tree.itemDoubleClicked.connect(self._on_device_item_double_clicked)
+        self.devices_tree.doubleClicked.connect(self._on_device_double_clicked)
         devices_layout.addWidget(self.devices_tree)
         header = self.devices_tree.header()
         header.setStretchLastSection(False)
         header.setSectionResizeMode(0, QHeaderView.Interactive)
         header.setSectionResizeMode(1, QHeaderView.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
+        # Kolumny dopasowywane do treści jednorazowo (po pierwszym wypełnieniu listy),
+        # a nie przy każdej zmianie danych - dalej użytkownik może zmieniać ich szerokość
+        header.setSectionResizeMode(2, QHeaderView.Interactive)
+        header.setSectionResizeMode(3, QHeaderView.Interactive)
+        header.setSectionResizeMode(4, QHeaderView.Interactive)
         header.setMinimumSectionSize(120)
         # Ustaw początkową szerokość kolumn
         header.resizeSection(0, 200)  # Nazwa - ograniczona szerokość
@@ -350,143 +812,11 @@ class MainWindow(QMainWindow):
         self._sync_copy_buttons()
 
     def _apply_styles(self):
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2b2d30;
-            }
-            QLabel {
-                color: #c9d1d9;
-            }
-            QLabel#AppTitle {
-                font-size: 20px;
-                font-weight: bold;
-                color: #8ab4f8;
-            }
-            QLabel#LastRefresh {
-                color: #8b949e;
-                font-size: 11px;
-            }
-            QGroupBox {
-                background-color: #313335;
-                border: 1px solid #454749;
-                border-radius: 8px;
-                margin-top: 1ex;
-                font-weight: bold;
-                color: #9db1c5;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 10px;
-                background-color: #3c3f41;
-                border-radius: 4px;
-                color: #c9d1d9;
-                left: 10px;
-            }
-            QPushButton {
-                background-color: #4c5052;
-                color: #dfe1e5;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #5a6164;
-                color: #ffffff;
-            }
-            QPushButton:pressed {
-                background-color: #3d4043;
-            }
-            QPushButton:disabled {
-                background-color: #3c3f41;
-                color: #6e7681;
-            }
-
-            QToolButton#AddressCopyButton {
-                background-color: #4c5052;
-                color: #dfe1e5;
-                border: none;
-                padding: 4px 10px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QToolButton#AddressCopyButton:hover {
-                background-color: #5a6164;
-                color: #ffffff;
-            }
-            QToolButton#AddressCopyButton:pressed {
-                background-color: #3d4043;
-            }
-            QToolButton#AddressCopyButton:disabled {
-                background-color: #3c3f41;
-                color: #6e7681;
-            }
-
-            QPushButton#ToggleButton[connected="true"] {
-                background-color: #d73a49;
-                color: #ffffff;
-            }
-            QPushButton#ToggleButton[connected="true"]:hover {
-                background-color: #e5505e;
-            }
-            QPushButton#ToggleButton[connected="false"] {
-                background-color: #28a745;
-                color: #ffffff;
-            }
-            QPushButton#ToggleButton[connected="false"]:hover {
-                background-color: #34c759;
-            }
-            QTreeWidget {
-                background-color: #313335;
-                border: 1px solid #454749;
-                border-radius: 6px;
-                color: #c9d1d9;
-            }
-            QTreeWidget::item {
-                padding: 4px 2px;
-            }
-            QTreeWidget::item:selected {
-                background-color: #3e4447;
-                color: #ffffff;
-            }
-            QTreeWidget::item:hover {
-                background-color: #383b3d;
-            }
-            QHeaderView::section {
-                background-color: #3c3f41;
-                color: #8ab4f8;
-                padding: 6px;
-                border: 1px solid #454749;
-                font-weight: bold;
-            }
-            QComboBox {
-                background-color: #313335;
-                border: 1px solid #454749;
-                border-radius: 4px;
-                padding: 4px;
-                color: #c9d1d9;
-            }
-            QComboBox:hover {
-                border: 1px solid #5a6164;
-            }
-            QComboBox:disabled {
-                color: #6e7681;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QCheckBox {
-                color: #c9d1d9;
-            }
-            QStatusBar {
-                background-color: #282829;
-                color: #c9d1d9;
-            }
-            QSplitter::handle {
-                background-color: #454749;
-            }
-        """)
+        # Arkusz ustawiany raz na poziomie aplikacji - Qt parsuje go jednokrotnie;
+        # run() ustawia go już przed budową okna, tu tylko gdy okno tworzone jest inaczej
+        app = QApplication.instance()
+        if app and app.styleSheet() != _STYLESHEET:
+            app.setStyleSheet(_STYLESHEET)
 
     # --- Zasobnik systemowy ---
     def _init_tray(self):
@@ -495,7 +825,7 @@ class MainWindow(QMainWindow):
 
         icon = self.windowIcon()
         if icon.isNull():
-            icon = self.style().standardIcon(QStyle.SP_ComputerIcon)
+            icon = _std_icon(self.style(), QStyle.SP_ComputerIcon)
 
         self._tray_icon = QSystemTrayIcon(icon, self)
         self._tray_icon.setToolTip("TailUI")
@@ -539,28 +869,10 @@ class MainWindow(QMainWindow):
             self._hide_window_to_tray()
 
     def _on_tray_connect(self):
-        if not self.client or self._busy_toggle:
-            return
-        try:
-            status = self.client.status()
-            if status.connected:
-                self.statusBar().showMessage("Tailscale jest już połączony", 3000)
-                return
-        except TailscaleError:
-            pass
-        self.start_connection()
+        self._request_connection(True)
 
     def _on_tray_disconnect(self):
-        if not self.client or self._busy_toggle:
-            return
-        try:
-            status = self.client.status()
-            if not status.connected:
-                self.statusBar().showMessage("Tailscale jest już rozłączony", 3000)
-                return
-        except TailscaleError:
-            pass
-        self.stop_connection()
+        self._request_connection(False)
 
     def _show_window_from_tray(self):
         self.show()
@@ -583,6 +895,8 @@ class MainWindow(QMainWindow):
         connected = False
         if status is not None:
             connected = status.connected
+        elif self._last_connected is not None:
+            connected = self._last_connected
         else:
             connected = bool(self.toggle_button.property("connected"))
 
@@ -620,7 +934,48 @@ class MainWindow(QMainWindow):
 
     def showEvent(self, event):
         super().showEvent(event)
+        self._flush_hidden_status()
         self._update_tray_menu_status()
+        self._resume_polling()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._pause_polling()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self._pause_polling()
+            else:
+                self._flush_hidden_status()
+                self._resume_polling()
+
+    def _flush_hidden_status(self):
+        # Status odebrany, gdy okno było ukryte lub zminimalizowane - renderujemy go teraz
+        if self._hidden_status is not None:
+            st, self._hidden_status = self._hidden_status, None
+            self._render_status(st)
+
+    def _tray_visible(self) -> bool:
+        return bool(self._tray_icon and self._tray_icon.isVisible())
+
+    def _pause_polling(self):
+        # Okno niewidoczne - bez częstego `tailscale status`; trwające przejście
+        # (połączenie/rozłączenie) nadal korzysta z własnego _poll_timer.
+        # Ikona w zasobniku pokazuje stan, więc wtedy odpytujemy rzadko zamiast wcale
+        if self._tray_visible():
+            self._next_refresh.start(self.REFRESH_IDLE_MAX_MS)
+        else:
+            self._next_refresh.stop()
+
+    def _resume_polling(self):
+        if self._status_in_flight:
+            return
+        # Rzadkie odpytywanie z tła nie może opóźniać odświeżenia po pokazaniu okna
+        if self._next_refresh.isActive() and self._next_refresh.remainingTime() <= self.REFRESH_MS:
+            return
+        self.refresh_status(force=True)
 
     # --- Pomocnicze busy ---
     def _set_busy(self, busy: bool):
@@ -629,53 +984,68 @@ class MainWindow(QMainWindow):
         self._update_tray_menu_status()
 
     def _start_poll(self, target_connected: bool, down_started: bool = False):
-        if self._poll_timer:
-            self._poll_timer.stop()
-            self._poll_timer.deleteLater()
         self._poll_target = target_connected
-        self._poll_started_at = time.time()
+        self._poll_started_at = time.monotonic()
         if down_started:
             self._down_started_at = self._poll_started_at
-        self._poll_timer = QTimer(self)
-        self._poll_timer.timeout.connect(self._poll_iteration)
-        self._poll_timer.start(300)
+        self._poll_next_interval_ms = self._poll_initial_interval_ms
+        self._poll_timer.start(self._poll_next_interval_ms)
+
+    def _schedule_next_poll(self):
+        if self._poll_target is None:
+            return
+        self._poll_next_interval_ms = min(int(self._poll_next_interval_ms * 1.5), self._poll_interval_cap_ms)
+        self._poll_timer.start(self._poll_next_interval_ms)
 
     def _poll_iteration(self):
         if not self.client:
             self._finish_transition(error_msg="Brak klienta")
             return
 
-        elapsed = time.time() - self._poll_started_at
+        elapsed = time.monotonic() - self._poll_started_at
         timeout_limit = self._disconnect_timeout_sec if self._poll_target is False else self._poll_timeout_sec
 
         if elapsed > timeout_limit:
             self._finish_transition(error_msg="Przekroczono czas oczekiwania na zmianę stanu")
             return
 
-        try:
-            st = self.client.status()
-            if st.connected == self._poll_target:
-                self._finish_transition(status_msg="Połączono" if st.connected else "Rozłączono")
-                return
+        # Poprzednie zapytanie jeszcze trwa - kolejną iterację zaplanuje jego wynik
+        if self._poll_status_in_flight:
+            return
 
-            if self._poll_target is False and (time.time() - self._down_started_at) >= self._disconnect_grace_sec:
-                if st.backend_state.lower() != 'running':
-                    self._finish_transition(status_msg="Rozłączono (backend zatrzymany)")
-                    return
-        except TailscaleError:
-            if self._poll_target is False:
-                self._finish_transition(status_msg="Rozłączono (status niedostępny)")
+        self._poll_status_in_flight = True
+        self._submit_worker(self.client.status, self._on_poll_status, self._on_poll_status_error,
+                            pool=self._status_pool)
+
+    def _on_poll_status(self, st: Status):
+        self._poll_status_in_flight = False
+        if self._poll_target is None:
+            return
+
+        if st.connected == self._poll_target:
+            self._finish_transition(status_msg="Połączono" if st.connected else "Rozłączono")
+            return
+
+        if self._poll_target is False and (time.monotonic() - self._down_started_at) >= self._disconnect_grace_sec:
+            if st.backend_state not in _RUNNING_STATES:
+                self._finish_transition(status_msg="Rozłączono (backend zatrzymany)")
                 return
 
+        self._schedule_next_poll()
+
+    def _on_poll_status_error(self, msg: str):
+        self._poll_status_in_flight = False
+        if self._poll_target is False:
+            self._finish_transition(status_msg="Rozłączono (status niedostępny)")
+            return
+        self._schedule_next_poll()
+
     def _finish_transition(self, error_msg: Optional[str] = None, status_msg: Optional[str] = None):
-        if self._poll_timer:
-            self._poll_timer.stop()
-            self._poll_timer.deleteLater()
-            self._poll_timer = None
+        self._poll_timer.stop()
         self._poll_target = None
         self._set_busy(False)
+        # Zmianę łączności wykryje _apply_status i wymusi pobranie publicznego IP
         self.refresh_status(force=True)
-        self.fetch_public_ip(force=True)
 
         if error_msg:
             self._error(error_msg)
@@ -683,17 +1053,45 @@ class MainWindow(QMainWindow):
             self.statusBar().showMessage(status_msg, 4000)
 
     def _handle_toggle_connection(self):
+        self._request_connection(None)
+
+    def _request_connection(self, target: Optional[bool]):
+        """Sprawdza bieżący stan w tle i łączy/rozłącza (target=None - przełącza)."""
         if not self.client or self._busy_toggle:
             return
+        # Do czasu odpowiedzi `tailscale status` przełącznik pozostaje zablokowany
+        self._set_busy(True)
 
-        try:
-            status = self.client.status()
-            if status.connected:
-                self.stop_connection()
+        def on_status(st: Status):
+            self._set_busy(False)
+            # Świeży status - menu zasobnika nie może pokazywać nieaktualnego stanu.
+            # _last_connected zostaje dla _apply_status (wykrywa zmianę i wymusza pobranie IP)
+            self._update_tray_menu_status(st)
+            want_connected = (not st.connected) if target is None else target
+            if want_connected == st.connected:
+                msg = "Tailscale jest już połączony" if st.connected else "Tailscale jest już rozłączony"
+                if self.isHidden() and self._tray_icon:
+                    self._tray_icon.showMessage("TailUI", msg, QSystemTrayIcon.Information, 3000)
+                else:
+                    self.statusBar().showMessage(msg, 3000)
+                return
+            if want_connected:
+                self.start_connection()
             else:
+                self.stop_connection()
+
+        def on_error(msg: str):
+            self._set_busy(False)
+            if target is None:
+                self._error(f"Nie można pobrać statusu: {msg}")
+                return
+            # Z zasobnika cel jest znany - próbujemy mimo braku statusu
+            if target:
                 self.start_connection()
-        except TailscaleError as e:
-            self._error(f"Nie można pobrać statusu: {e}")
+            else:
+                self.stop_connection()
+
+        self._submit_worker(self.client.status, on_status, on_error, pool=self._status_pool)
 
     def start_connection(self):
         self._set_busy(True)
@@ -703,9 +1101,8 @@ class MainWindow(QMainWindow):
         if self.exit_enable_checkbox.isChecked():
             desired_exit_node = self.exit_node_combo.currentData()
             if desired_exit_node is None and self.exit_node_combo.count() > 0:
-                self.exit_node_combo.blockSignals(True)
-                self.exit_node_combo.setCurrentIndex(0)
-                self.exit_node_combo.blockSignals(False)
+                with QSignalBlocker(self.exit_node_combo):
+                    self.exit_node_combo.setCurrentIndex(0)
                 desired_exit_node = self.exit_node_combo.currentData()
             if desired_exit_node:
                 desired_exit_node = str(desired_exit_node)
@@ -765,33 +1162,46 @@ class MainWindow(QMainWindow):
                 user_selected_value = str(user_selected_value)
             user_has_selection = self.exit_enable_checkbox.isChecked()
 
-        self.exit_node_combo.blockSignals(True)
-        self.exit_node_combo.clear()
-        self._exit_entries.clear()
-        self._exit_alias_map.clear()
+        active_device = status.active_exit_node
+        active_id = active_device.device_id if active_device else None
+        active_value = None
 
+        entries = []
         for device in status.exit_nodes:
             command_value = self._preferred_exit_node_argument(device)
             if not command_value:
                 continue
-            command_value = str(command_value)
+            # Aktywny exit node rozpoznajemy już tutaj - zwykle bez osobnego przejścia po aliasach
+            if active_id and device.device_id == active_id and active_value is None:
+                active_value = command_value
             label = self._format_exit_label(device, command_value)
-            self.exit_node_combo.addItem(label, command_value)
-            self._exit_entries[command_value] = label
-            for alias in self._exit_aliases_for_device(device):
-                self._exit_alias_map[alias] = command_value
+            entries.append((command_value, label, frozenset(self._exit_aliases_for_device(device))))
+        sig = tuple(entries)
+
+        # Lista exit node zmienia się rzadko - przebudowujemy combo tylko przy zmianie
+        if sig != self._exit_nodes_sig:
+            self._exit_nodes_sig = sig
+            self._exit_entries.clear()
+            self._exit_alias_map.clear()
+            with QSignalBlocker(self.exit_node_combo):
+                self.exit_node_combo.clear()
+                # Wszystkie etykiety jednym wstawieniem do modelu, dane (UserRole) osobno
+                self.exit_node_combo.addItems([label for _, label, _ in entries])
+                for i, (command_value, label, aliases) in enumerate(entries):
+                    self.exit_node_combo.setItemData(i, command_value)
+                    self._exit_entries[command_value] = label
+                    self._exit_alias_map.update(dict.fromkeys(aliases, command_value))
 
         self._exit_has_nodes = self.exit_node_combo.count() > 0
 
-        active_value = None
-        if status.active_exit_node:
-            for alias in self._exit_aliases_for_device(status.active_exit_node):
+        if active_device and active_value is None:
+            for alias in self._exit_aliases_for_device(active_device):
                 mapped = self._exit_alias_map.get(alias)
                 if mapped:
                     active_value = mapped
                     break
             if not active_value:
-                preferred = self._preferred_exit_node_argument(status.active_exit_node)
+                preferred = self._preferred_exit_node_argument(active_device)
                 if preferred and preferred in self._exit_entries:
                     active_value = preferred
 
@@ -802,14 +1212,13 @@ class MainWindow(QMainWindow):
         else:
             target_value = active_value
         
-        if target_value and target_value in self._exit_entries:
-            idx = self.exit_node_combo.findData(target_value)
-            if idx >= 0:
-                self.exit_node_combo.setCurrentIndex(idx)
-        elif self._exit_has_nodes and self.exit_node_combo.currentIndex() == -1:
-            self.exit_node_combo.setCurrentIndex(0)
-
-        self.exit_node_combo.blockSignals(False)
+        with QSignalBlocker(self.exit_node_combo):
+            if target_value and target_value in self._exit_entries:
+                idx = self.exit_node_combo.findData(target_value)
+                if idx >= 0 and idx != self.exit_node_combo.currentIndex():
+                    self.exit_node_combo.setCurrentIndex(idx)
+            elif self._exit_has_nodes and self.exit_node_combo.currentIndex() == -1:
+                self.exit_node_combo.setCurrentIndex(0)
 
         self._exit_active_value = active_value
 
@@ -822,31 +1231,31 @@ class MainWindow(QMainWindow):
                 self._exit_pending_state = None
 
         # Jeśli jesteśmy w trakcie operacji LUB czekamy na potwierdzenie - nie dotykaj checkbox
-        if not in_exit_operation and self._exit_pending_state is None:
-            self.exit_enable_checkbox.blockSignals(True)
-            # Ustaw checkbox na podstawie rzeczywistego stanu z serwera
-            self.exit_enable_checkbox.setChecked(active_value is not None)
-            self.exit_enable_checkbox.blockSignals(False)
+        # Ustaw checkbox na podstawie rzeczywistego stanu z serwera (tylko gdy się różni)
+        if (not in_exit_operation and self._exit_pending_state is None
+                and self.exit_enable_checkbox.isChecked() != (active_value is not None)):
+            with QSignalBlocker(self.exit_enable_checkbox):
+                self.exit_enable_checkbox.setChecked(active_value is not None)
 
         self._sync_exit_controls_enabled()
 
     @staticmethod
-    def _exit_aliases_for_device(device: Device) -> Set[str]:
-        aliases: Set[str] = set()
+    def _exit_aliases_for_device(device: Device) -> Iterator[str]:
+        # Generator - wywołujący sam decyduje, czy potrzebuje zbioru, czy tylko pierwszego trafienia
         if not device:
-            return aliases
+            return
         if device.name:
-            aliases.add(str(device.name))
+            yield str(device.name)
         if device.device_id:
-            aliases.add(str(device.device_id))
-        if device.tailnet_ips:
-            aliases.update(str(ip) for ip in device.tailnet_ips if ip)
+            yield str(device.device_id)
+        for ip in device.tailnet_ips or ():
+            if ip:
+                yield str(ip)
         hostinfo = device.hostinfo or {}
         for key in ("Hostname", "DNSName"):
             value = hostinfo.get(key)
             if value:
-                aliases.add(str(value))
-        return aliases
+                yield str(value)
 
     @staticmethod
     def _format_exit_label(device: Device, command_value: str) -> str:
@@ -973,6 +1382,9 @@ class MainWindow(QMainWindow):
                 return
             target = str(target)
             label = self.exit_node_combo.currentText()
+            if target == self._exit_active_value:
+                self.statusBar().showMessage(f"Exit node jest już ustawiony: {label}", 3000)
+                return
             self._exit_pending_state = True  # Oczekujemy włączenia exit node
             self._perform_exit_operation(
                 lambda: self.client.set_exit_node(target),
@@ -1002,7 +1414,6 @@ class MainWindow(QMainWindow):
         self._exit_busy = False
         self.statusBar().showMessage(message, 4000)
         self.refresh_status(force=True)
-        self.fetch_public_ip(force=True)
         self._sync_exit_controls_enabled()
 
     def _on_exit_operation_error(self, msg: str):
@@ -1011,7 +1422,6 @@ class MainWindow(QMainWindow):
         if msg:
             self._error(msg)
         self.refresh_status(force=True)
-        self.fetch_public_ip(force=True)
         self._sync_exit_controls_enabled()
 
     def _error(self, msg: str):
@@ -1027,110 +1437,177 @@ class MainWindow(QMainWindow):
             self._sync_exit_controls_enabled()
             self._update_tray_menu_status()
             return
-        try:
-            st = self.client.status()
-        except TailscaleError as e:
-            self.status_label.setText(f"błąd: {e}")
-            self._exit_has_nodes = False
-            self._exit_active_value = None
-            self._sync_exit_controls_enabled()
-            self._update_self_ips(None)
+        if force:
+            # Wymuszone odświeżenie przerysowuje wszystkie sekcje, nie tylko zmienione
+            self._status_cache.invalidate()
+        elif self._status_is_fresh():
+            # Seria wywołań tuż po odświeżeniu - bez kolejnego podprocesu
+            if not self._next_refresh.isActive():
+                self._schedule_next(self.REFRESH_MS)
             return
+        if self._status_in_flight:
+            # Wynik trwającego zapytania może być już nieaktualny - powtórz po nim
+            if force:
+                self._status_refresh_queued = True
+            return
+        if force and self._last_refresh_mono is not None:
+            # Throttling z wyzwoleniem na końcu okna - ostatnie wymuszenie zawsze zostaje wykonane
+            wait_ms = int((self.FORCED_REFRESH_MIN_GAP_SEC - (time.monotonic() - self._last_refresh_mono)) * 1000)
+            if wait_ms > 0:
+                if not self._forced_refresh_throttle.isActive():
+                    self._forced_refresh_throttle.start(wait_ms)
+                return
 
-        self._update_tray_menu_status(st)
-
-        # Status tekstowy
-        self.status_label.setText(f"{st.backend_state} | Połączony: {'tak' if st.connected else 'nie'}")
+        self._status_in_flight = True
+        self._submit_worker(self.client.status, self._on_status_ready, self._on_status_error,
+                            pool=self._status_pool)
 
-        # Aktualizacja stanów przycisków
-        if not self._busy_toggle:
-            style = self.style()
-            self.toggle_button.setProperty("connected", st.connected)
-            if st.connected:
-                self.toggle_button.setText("Rozłącz")
-                self.toggle_button.setIcon(style.standardIcon(QStyle.SP_MediaStop))
-            else:
-                self.toggle_button.setText("Połącz")
-                self.toggle_button.setIcon(style.standardIcon(QStyle.SP_MediaPlay))
+    def _status_is_fresh(self) -> bool:
+        return self._last_refresh_mono is not None and (time.monotonic() - self._last_refresh_mono) < self.STATUS_TTL_SEC
 
-            self.toggle_button.style().unpolish(self.toggle_button)
-            self.toggle_button.style().polish(self.toggle_button)
-            self.toggle_button.setEnabled(True)
+    def _on_status_ready(self, st: Status):
+        self._status_in_flight = False
+        self._apply_status(st)
+        if self._status_refresh_queued:
+            self._status_refresh_queued = False
+            self.refresh_status(force=True)
 
-        # Aktualizacja listy urządzeń
-        self._populate_devices(st)
+    def _on_status_error(self, msg: str):
+        self._status_in_flight = False
+        self._status_cache.invalidate()
+        self._exit_has_nodes = False
+        self._exit_active_value = None
+        self._sync_exit_controls_enabled()
+        # Starszy status odłożony w ukryciu nie może po pokazaniu nadpisać komunikatu o błędzie
+        self._hidden_status = None
+        if self._last_good_status is not None:
+            # Lista urządzeń i własne IP zostają - oznaczamy je tylko jako nieaktualne
+            self.status_label.setText(f"⚠ dane nieaktualne (błąd: {msg})")
+        else:
+            self.status_label.setText(f"błąd: {msg}")
+            self._update_self_ips(None)
+        self._schedule_next(self.REFRESH_MS)
+        if self._status_refresh_queued:
+            self._status_refresh_queued = False
+            self.refresh_status(force=True)
 
-        # Adresy własne
-        self._update_self_ips(st.self_device)
+    def _apply_status(self, st: Status):
+        self._last_good_status = st
+        self._update_tray_menu_status(st)
 
-        self._refresh_exit_nodes(st)
+        # Zmiana łączności lub exit node - publiczne IP pobieramy z pominięciem TTL.
+        # Poza tym zwykłe pobranie przy każdym statusie: w oknie TTL kończy się na cached(),
+        # a po jego wygaśnięciu wykrywa zmianę sieci (np. Wi-Fi -> LTE) bez zmiany łączności
+        current_exit = st.active_exit_node.name if st.active_exit_node else None
+        need_force = (st.connected != self._last_connected) or (current_exit != self._last_exit_node)
+        self._last_connected = st.connected
+        self._last_exit_node = current_exit
+        self.fetch_public_ip(force=need_force)
 
-        # Znacznik czasu
         self._last_refresh_ts = time.time()
-        self.last_refresh_label.setText(
-            f"Odświeżono: {QDateTime.currentDateTime().toString('HH:mm:ss')}"
-        )
-
-    def _populate_devices(self, status):
-        # Zapisz pozycję przewijania przed wyczyszczeniem
-        scrollbar = self.devices_tree.verticalScrollBar()
-        scroll_position = scrollbar.value() if scrollbar else 0
-
-        self.devices_tree.clear()
-        for d in status.devices:
-            flags = []
-            if d.is_exit_node:
-                flags.append("(aktywny exit)")
-            if not d.online:
-                flags.append("offline")
-            status_text = "online" if d.online else "offline"
-            exit_text = "tak" if d.is_exit_node else ("możliwy" if d.exit_node_option else "-")
-            ipv4_list: List[str] = []
-            ipv6_list: List[str] = []
-            if d.tailnet_ips:
-                for ip in d.tailnet_ips:
-                    normalized = (ip or "").strip()
-                    if not normalized:
-                        continue
-                    if ":" in normalized:
-                        ipv6_list.append(normalized)
-                    else:
-                        ipv4_list.append(normalized)
-            addresses_text = ", ".join(ip for ip in (d.tailnet_ips or []) if ip) if (d.tailnet_ips) else "-"
-            item = QTreeWidgetItem([
-                d.name,
-                "",
-                status_text,
-                exit_text,
-                d.os or "-"
-            ])
-            item.setData(1, self.DEVICE_IPV4_ROLE, ipv4_list)
-            item.setData(1, self.DEVICE_IPV6_ROLE, ipv6_list)
-            item.setData(1, self.DEVICE_ADDR_TEXT_ROLE, addresses_text)
-            if not d.online:
-                for col in range(self.devices_tree.columnCount()):
-                    item.setForeground(col, QColor('#888'))
-            if d.is_exit_node:
-                item.setForeground(3, QColor('#ffd479'))
-            self.devices_tree.addTopLevelItem(item)
-            address_widget = self._create_device_addresses_widget(addresses_text, ipv4_list, ipv6_list)
-            self.devices_tree.setItemWidget(item, 1, address_widget)
-            self._update_device_item_size(item)
-        header = self.devices_tree.header()
-        for i in range(self.devices_tree.columnCount()):
-            if i == 1:
-                continue
-            self.devices_tree.resizeColumnToContents(i)
+        self._last_refresh_mono = time.monotonic()
+        # Okno ukryte (np. w zasobniku) lub zminimalizowane - zachowaj stan i odśwież
+        # widgety dopiero przy pokazaniu/przywróceniu
+        if self.isVisible() and not self.isMinimized():
+            self._hidden_status = None
+            self._render_status(st)
+        else:
+            self._hidden_status = st
 
-        # Zapewnij minimalną szerokość dla kolumny adresów, ale pozwól jej wypełniać resztę miejsca
-        if header.sectionSize(1) < 420:
-            header.resizeSection(1, 420)
+        state_key = (st.backend_state, st.connected, current_exit)
+        if state_key != self._last_state_key:
+            self._last_state_key = state_key
+            self._steady_polls = 0
+            self._schedule_next(self.REFRESH_CHANGED_MS)
+        else:
+            self._steady_polls += 1
+            if st.connected and self._steady_polls >= self.STEADY_POLLS:
+                # Wykładniczy backoff: 15 s, 30 s, 60 s, ...
+                idle_steps = min(self._steady_polls - self.STEADY_POLLS, 8)
+                self._schedule_next(min(self.REFRESH_STEADY_MS << idle_steps, self.REFRESH_IDLE_MAX_MS))
+            else:
+                self._schedule_next(self.REFRESH_MS)
+
+    def _schedule_next(self, delay_ms: int):
+        # Gdy okno jest ukryte lub zminimalizowane, odpytywanie wznowi showEvent/changeEvent;
+        # przy widocznej ikonie w zasobniku odpytujemy tylko rzadko
+        if self.isHidden() or self.isMinimized():
+            if self._tray_visible():
+                self._next_refresh.start(max(delay_ms, self.REFRESH_IDLE_MAX_MS))
+            return
+        # Restart timera anuluje wcześniej zaplanowane odświeżenie
+        self._next_refresh.start(delay_ms)
+
+    def _render_status(self, st: Status):
+        # Widgety aktualizowane przez sloty podpięte do sygnałów StatusCache - tylko te
+        # fragmenty, które zmieniły się od poprzedniego odświeżenia. Bez setUpdatesEnabled
+        # wokół całości: jego ponowne włączenie odmalowuje całe okno nawet bez zmian,
+        # a Qt i tak łączy wywołania update() w jedno odmalowanie na przebieg pętli zdarzeń
+        self._status_cache.update(st)
+
+        # Znacznik czasu (moment pobrania statusu, nie wyświetlenia)
+        refreshed_text = "Odświeżono: " + time.strftime('%H:%M:%S', time.localtime(self._last_refresh_ts))
+        if refreshed_text != self._last_refresh_display:
+            self._last_refresh_display = refreshed_text
+            self.last_refresh_label.setText(refreshed_text)
+
+    def _on_connected_changed(self, st: Status):
+        # Status tekstowy
+        self.status_label.setText(f"{st.backend_state} | Połączony: {'tak' if st.connected else 'nie'}")
 
-        self._refresh_device_items_layout()
+        # Aktualizacja stanów przycisków
+        if not self._busy_toggle:
+            # Tekst zawsze (mógł zostać zmieniony na "Łączenie…"), reszta tylko przy zmianie stanu
+            self.toggle_button.setText("Rozłącz" if st.connected else "Połącz")
+
+            # Ponowne polerowanie (przeliczenie reguł QSS) tylko gdy właściwość faktycznie się zmienia
+            if self.toggle_button.property("connected") != st.connected:
+                style = self.style()
+                self.toggle_button.setIcon(
+                    _std_icon(style, QStyle.SP_MediaStop if st.connected else QStyle.SP_MediaPlay)
+                )
+                self.toggle_button.setProperty("connected", st.connected)
+                style.unpolish(self.toggle_button)
+                style.polish(self.toggle_button)
+            self.toggle_button.setEnabled(True)
 
-        # Przywróć pozycję przewijania po odświeżeniu listy
-        if scrollbar and scroll_position > 0:
-            scrollbar.setValue(scroll_position)
+    def _populate_devices(self, status):
+        # Zmiana na liście urządzeń - wracamy do zwykłego tempa odpytywania
+        self._steady_polls = 0
+        # Model porównuje dane z bieżącymi wierszami i emituje tylko potrzebne zmiany;
+        # widgety adresów odtwarzamy wyłącznie dla nowych lub zmienionych wierszy
+        tree = self.devices_tree
+        # Sortowanie wyłączone na czas aktualizacji - jedno sortowanie zamiast po każdej zmianie
+        self._devices_proxy.setDynamicSortFilter(False)
+        try:
+            address_rows, rows_changed = self.devices_model.set_devices(status.devices)
+
+            for row in address_rows:
+                index = self.devices_model.index(row, DevicesModel.ADDRESSES_COLUMN)
+                address_widget = self._create_device_addresses_widget(
+                    index.data(DevicesModel.ADDR_TEXT_ROLE),
+                    index.data(DevicesModel.IPV4_ROLE) or [],
+                    index.data(DevicesModel.IPV6_ROLE) or [],
+                )
+                tree.setIndexWidget(self._devices_proxy.mapFromSource(index), address_widget)
+                self._update_device_item_size(row)
+        finally:
+            self._devices_proxy.setDynamicSortFilter(True)
+
+        if rows_changed and not self._devices_columns_sized and self.devices_model.rowCount():
+            self._devices_columns_sized = True
+            header = tree.header()
+            for i in range(self.devices_model.columnCount()):
+                if i == DevicesModel.ADDRESSES_COLUMN:
+                    continue
+                tree.resizeColumnToContents(i)
+
+            # Zapewnij minimalną szerokość dla kolumny adresów, ale pozwól jej wypełniać resztę miejsca
+            if header.sectionSize(1) < 420:
+                header.resizeSection(1, 420)
+
+        if rows_changed or address_rows:
+            self._refresh_device_items_layout()
 
     def _create_device_addresses_widget(self, addresses_text: str, ipv4_list: List[str], ipv6_list: List[str]) -> QWidget:
         container = QWidget()
@@ -1192,18 +1669,17 @@ class MainWindow(QMainWindow):
         return container
 
     @staticmethod
-    def _get_device_addresses_text(item: Optional[QTreeWidgetItem]) -> str:
-        if not item:
+    def _get_device_addresses_text(index: QModelIndex) -> str:
+        if not index.isValid():
             return ""
-        value = item.data(1, MainWindow.DEVICE_ADDR_TEXT_ROLE)
+        value = index.siblingAtColumn(DevicesModel.ADDRESSES_COLUMN).data(MainWindow.DEVICE_ADDR_TEXT_ROLE)
         if value is None:
             return ""
         return str(value).strip()
 
-    def _update_device_item_size(self, item: QTreeWidgetItem, column_width: Optional[int] = None):
-        if not item:
-            return
-        widget = self.devices_tree.itemWidget(item, 1)
+    def _update_device_item_size(self, row: int, column_width: Optional[int] = None):
+        index = self.devices_model.index(row, DevicesModel.ADDRESSES_COLUMN)
+        widget = self.devices_tree.indexWidget(self._devices_proxy.mapFromSource(index))
         if not widget:
             return
 
@@ -1226,17 +1702,15 @@ class MainWindow(QMainWindow):
             layout.activate()
 
         # Ustaw size hint bez zmiany własności widgetu
-        size_hint = widget.sizeHint()
-        item.setSizeHint(1, size_hint)
+        self.devices_model.set_size_hint(row, widget.sizeHint())
 
     def _refresh_device_items_layout(self):
         if not hasattr(self, "devices_tree"):
             self._devices_layout_refresh_pending = False
             return
         column_width = self.devices_tree.columnWidth(1)
-        for index in range(self.devices_tree.topLevelItemCount()):
-            item = self.devices_tree.topLevelItem(index)
-            self._update_device_item_size(item, column_width)
+        for row in range(self.devices_model.rowCount()):
+            self._update_device_item_size(row, column_width)
         self._devices_layout_refresh_pending = False
 
     def _schedule_devices_layout_refresh(self):
@@ -1254,7 +1728,7 @@ class MainWindow(QMainWindow):
         self._self_ipv6_list = []
 
         if not device or not device.tailnet_ips:
-            self.self_ips_label.setText("-")
+            self._set_self_ips_text("-")
             self._sync_copy_buttons()
             return
 
@@ -1276,19 +1750,25 @@ class MainWindow(QMainWindow):
         if not segments:
             segments.append(", ".join(ip for ip in device.tailnet_ips if ip))
 
-        self.self_ips_label.setText(" | ".join(segments) if segments else "-")
+        self._set_self_ips_text(" | ".join(segments) if segments else "-")
         self._sync_copy_buttons()
 
+    def _set_self_ips_text(self, text: str):
+        # Pomijamy setText (i ponowny układ etykiety), gdy treść się nie zmieniła
+        if self.self_ips_label.text() != text:
+            self.self_ips_label.setText(text)
+
     def _on_device_context_menu(self, pos):
-        item = self.devices_tree.itemAt(pos)
-        if not item:
+        index = self.devices_tree.indexAt(pos)
+        if not index.isValid():
             return
 
         menu = QMenu(self.devices_tree)
-        name = item.text(0).strip()
-        addresses = self._get_device_addresses_text(item)
-        ipv4_list = item.data(1, self.DEVICE_IPV4_ROLE) or []
-        ipv6_list = item.data(1, self.DEVICE_IPV6_ROLE) or []
+        name = (index.siblingAtColumn(0).data() or "").strip()
+        addresses = self._get_device_addresses_text(index)
+        addresses_index = index.siblingAtColumn(DevicesModel.ADDRESSES_COLUMN)
+        ipv4_list = addresses_index.data(self.DEVICE_IPV4_ROLE) or []
+        ipv6_list = addresses_index.data(self.DEVICE_IPV6_ROLE) or []
 
         if name:
             menu.addAction("Kopiuj nazwę", lambda text=name: self._copy_to_clipboard(text, "Nazwa urządzenia"))
@@ -1312,18 +1792,32 @@ class MainWindow(QMainWindow):
             global_pos = self.devices_tree.viewport().mapToGlobal(pos)
             menu.exec(global_pos)
 
-    def _on_device_item_double_clicked(self, item, column):
+    def _on_device_double_clicked(self, index: QModelIndex):
+        column = index.column()
         if column == 1:
-            addresses = self._get_device_addresses_text(item)
+            addresses = self._get_device_addresses_text(index)
             if addresses and addresses != "-":
                 self._copy_to_clipboard(addresses.replace(", ", "\n"), "Adresy urządzenia")
         elif column == 0:
-            name = item.text(0).strip()
+            name = (index.data() or "").strip()
             if name:
                 self._copy_to_clipboard(name, "Nazwa urządzenia")
 
     def fetch_public_ip(self, force: bool = False):
+        self._ip_fetch_force = self._ip_fetch_force or force
+        if not self._ip_fetch_timer.isActive():
+            self._ip_fetch_timer.start(self.IP_FETCH_DEBOUNCE_MS)
+
+    def _do_fetch_public_ip(self):
+        force, self._ip_fetch_force = self._ip_fetch_force, False
+        # Tylko jedno zapytanie naraz; wymuszone pobranie w trakcie innego
+        # (np. po zmianie exit node) wykonujemy zaraz po jego zakończeniu
         if self._public_ip_pending:
+            if force:
+                self._public_ip_refetch_queued = True
+            return
+        # W oknie TTL wynik z cache jest już wyświetlony - bez wątku roboczego
+        if not force and self._ip_fetcher is not None and self._ip_fetcher.cached() is not None:
             return
 
         self._public_ip_pending = True
@@ -1334,59 +1828,59 @@ class MainWindow(QMainWindow):
         def on_success(info):
             self._public_ip_pending = False
             self._on_public_ip(info)
+            self._run_queued_public_ip_fetch()
 
         def on_error(msg: str):
             self._public_ip_pending = False
             if msg:
                 self.statusBar().showMessage(f"Nie udało się pobrać publicznego IP: {msg}", 5000)
             self._on_public_ip(None)
+            self._run_queued_public_ip_fetch()
 
         self._submit_worker(task, on_success, on_error)
 
-    def eventFilter(self, obj, event):
-        # Zdarzenia użytkownika wyzwalające przyspieszone odświeżenie
-        # Wykluczamy przewijanie na liście urządzeń, aby nie resetować pozycji
-        if event.type() == QEvent.Wheel:
-            if obj == self.devices_tree or obj == self.devices_tree.viewport():
-                return super().eventFilter(obj, event)
+    def _run_queued_public_ip_fetch(self):
+        if self._public_ip_refetch_queued:
+            self._public_ip_refetch_queued = False
+            self.fetch_public_ip(force=True)
 
-        if event.type() in (QEvent.MouseButtonPress, QEvent.KeyPress, QEvent.Wheel, QEvent.FocusIn):
-            self._schedule_interaction_refresh()
-        return super().eventFilter(obj, event)
+    def eventFilter(self, obj, event, _watched=_WATCHED_EVENTS):
+        # Zdarzenia użytkownika wyzwalające przyspieszone odświeżenie
+        # (zbiór związany jako argument domyślny - bez wyszukiwania globalnego)
+        if event.type() not in _watched:
+            return False
+        self._schedule_interaction_refresh()
+        return False
 
     def _schedule_interaction_refresh(self):
-        # Nie spamujemy – jeśli timer już odlicza, pozostawiamy
-        if not self._interaction_timer.isActive():
-            self._interaction_timer.start(self.INTERACTION_DEBOUNCE_MS)
-
-    def _interaction_refresh(self):
-        # Lekka ochrona przed zbyt częstym odpytywaniem – minimum 0.8s od ostatniego
-        now = time.time()
-        if self._last_refresh_ts and (now - self._last_refresh_ts) < 0.8:
-            # Odłóż jeszcze raz minimalnie jeśli aktywność była bardzo gęsta
-            self._interaction_timer.start(300)
+        # Użytkownik jest aktywny - wróć do zwykłego tempa odpytywania
+        self._steady_polls = 0
+        # Jedno odświeżenie po debounce, a przy świeżym wyniku dokładnie w chwili wygaśnięcia TTL
+        delay_ms = self.INTERACTION_DEBOUNCE_MS
+        if self._last_refresh_mono is not None:
+            # +50 ms zapasu: CoarseTimer może wystrzelić do 5% wcześniej
+            ttl_left_ms = int((self.STATUS_TTL_SEC - (time.monotonic() - self._last_refresh_mono)) * 1000) + 50
+            delay_ms = max(delay_ms, ttl_left_ms)
+        # Nie spamujemy – jeśli odświeżenie i tak nastąpi wcześniej, pozostawiamy
+        if self._next_refresh.isActive() and self._next_refresh.remainingTime() <= delay_ms:
             return
-        self.refresh_status(force=True)
-        self.fetch_public_ip()
+        self._schedule_next(delay_ms)
 
     def _on_public_ip(self, info):
         if not info:
+            self._last_rendered_public_ip = None
             self.public_ip_label.setText("Nie udało się pobrać")
             self.public_ip_details_label.setText("-")
             self._sync_copy_buttons()
             return
+        # Fetcher zwraca z cache ten sam obiekt - opis liczony raz (cached_property),
+        # a etykiet nie przerysowujemy bez potrzeby
+        rendered = (info.ip, info.details_text)
+        if rendered == self._last_rendered_public_ip:
+            return
+        self._last_rendered_public_ip = rendered
         self.public_ip_label.setText(info.ip)
-        details_parts = []
-        if info.org:
-            details_parts.append(info.org)
-        if info.asn:
-            org_tokens = set(info.org.split()) if info.org else set()
-            if info.asn not in org_tokens:
-                details_parts.append(f"ASN {info.asn}")
-        loc_parts = [p for p in [info.city, info.country] if p]
-        if loc_parts:
-            details_parts.append(", ".join(loc_parts))
-        self.public_ip_details_label.setText(" | ".join(details_parts) or "-")
+        self.public_ip_details_label.setText(info.details_text)
         self._sync_copy_buttons()
 
 
@@ -1404,6 +1898,8 @@ def run():
     app_icon = _load_app_icon()
     if app_icon:
         app.setWindowIcon(app_icon)
+    # Arkusz przed utworzeniem okna - widgety są polerowane tylko raz
+    app.setStyleSheet(_STYLESHEET)
     win = MainWindow()
     if app_icon:
         win.setWindowIcon(app_icon)
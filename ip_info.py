@@ -1,9 +1,11 @@
 import threading
 import time
 from dataclasses import dataclass, asdict
+from functools import cached_property
 from typing import Optional, Dict, Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 @dataclass
@@ -21,6 +23,19 @@ class PublicIPInfo:
         d = asdict(self)
         return d
 
+    @cached_property
+    def details_text(self) -> str:
+        """Opis do wyświetlenia: organizacja | ASN (jeśli nie ma go w nazwie) | miasto, kraj."""
+        parts = []
+        if self.org:
+            parts.append(self.org)
+        if self.asn and self.asn not in (self.org or "").split():
+            parts.append(f"ASN {self.asn}")
+        loc = ", ".join(p for p in (self.city, self.country) if p)
+        if loc:
+            parts.append(loc)
+        return " | ".join(parts) or "-"
+
 
 def _normalize_asn(value: Optional[str]) -> Optional[str]:
     if not value:
@@ -48,6 +63,11 @@ class PublicIPFetcher:
         self._cache: Optional[PublicIPInfo] = None
         self._cache_time: float = 0.0
         self._lock = threading.Lock()
+        # Wspólna sesja - keep-alive i wznawianie sesji TLS między zapytaniami
+        self._session = requests.Session()
+        self._session.headers.update({"User-Agent": "tailui/1.0"})
+        adapter = HTTPAdapter(pool_connections=3, pool_maxsize=4)
+        self._session.mount("https://", adapter)
 
     def _fetch(self) -> Optional[PublicIPInfo]:
         # Próby kilku źródeł w kolejności
@@ -56,10 +76,9 @@ class PublicIPFetcher:
             ("https://ipapi.co/json", self._parse_ipapi),
             ("https://ifconfig.co/json", self._parse_ifconfig),
         ]
-        headers = {"User-Agent": "tailui/1.0"}
         for url, parser in endpoints:
             try:
-                r = requests.get(url, timeout=5, headers=headers)
+                r = self._session.get(url, timeout=3)
                 if r.status_code == 200:
                     return parser(r.json())
             except Exception:
@@ -119,9 +138,15 @@ class PublicIPFetcher:
             raw=data,
         )
 
+    def cached(self) -> Optional[PublicIPInfo]:
+        """Zwraca wynik z cache, jeśli nie minął TTL (bez blokady i zapytań sieciowych)."""
+        if self._cache and (time.monotonic() - self._cache_time) < self.ttl:
+            return self._cache
+        return None
+
     def get_public_ip(self, force: bool = False) -> Optional[PublicIPInfo]:
         with self._lock:
-            now = time.time()
+            now = time.monotonic()
             if (not force and self._cache and (now - self._cache_time) < self.ttl):
                 return self._cache
             info = self._fetch()
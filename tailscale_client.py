@@ -5,6 +5,12 @@ import subprocess
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any, Tuple, Iterable
 
+try:
+    # Opcjonalnie szybszy parser; orjson.JSONDecodeError dziedziczy po json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class TailscaleError(Exception):
     pass
@@ -73,7 +79,7 @@ class TailscaleClient:
         if code != 0:
             raise TailscaleError(f"Błąd pobierania statusu tailscale: {err or out}")
         try:
-            data = json.loads(out)
+            data = _json_loads(out)
         except json.JSONDecodeError as e:
             raise TailscaleError(f"Niepoprawny JSON statusu: {e}\n{out[:500]}")
 
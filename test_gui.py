@@ -0,0 +1,162 @@
+import pytest
+
+from gui import DevicesModel, StatusCache
+from tailscale_client import Device, Status
+
+
+def _device(device_id, name=None, ips=("100.64.0.1",), online=True, **kwargs):
+    return Device(name=name or f"host-{device_id}", tailnet_ips=list(ips), online=online,
+                  device_id=device_id, **kwargs)
+
+
+def _status(devices, backend_state="Running", connected=True, self_device=None, active_exit_node=None):
+    return Status(
+        raw={},
+        backend_state=backend_state,
+        self_device=self_device,
+        devices=list(devices),
+        exit_nodes=[d for d in devices if d.exit_node_option],
+        connected=connected,
+        active_exit_node=active_exit_node,
+    )
+
+
+@pytest.fixture
+def model():
+    m = DevicesModel()
+    events = []
+    m.rowsInserted.connect(lambda parent, first, last: events.append(("insert", first, last)))
+    m.rowsRemoved.connect(lambda parent, first, last: events.append(("remove", first, last)))
+    m.dataChanged.connect(
+        lambda top_left, bottom_right, roles: events.append(
+            ("changed", top_left.row(), top_left.column(), bottom_right.column())
+        )
+    )
+    m.set_devices([_device("1"), _device("2", ips=("100.64.0.2",))])
+    events.clear()
+    return m, events
+
+
+def _names(m):
+    return [m.index(row, 0).data() for row in range(m.rowCount())]
+
+
+def test_insert_appends_new_rows(model):
+    m, events = model
+    address_rows, rows_changed = m.set_devices([_device("1"), _device("2", ips=("100.64.0.2",)), _device("3")])
+    assert rows_changed
+    assert address_rows == [2]
+    assert events == [("insert", 2, 2)]
+    assert _names(m) == ["host-1", "host-2", "host-3"]
+
+
+def test_remove_drops_only_vanished_rows(model):
+    m, events = model
+    address_rows, rows_changed = m.set_devices([_device("2", ips=("100.64.0.2",))])
+    assert rows_changed
+    assert address_rows == []
+    assert events == [("remove", 0, 0)]
+    assert _names(m) == ["host-2"]
+
+
+def test_unchanged_devices_emit_nothing(model):
+    m, events = model
+    assert m.set_devices([_device("1"), _device("2", ips=("100.64.0.2",))]) == ([], False)
+    assert events == []
+
+
+def test_text_change_updates_only_changed_column(model):
+    m, events = model
+    address_rows, rows_changed = m.set_devices([_device("1", os="linux"), _device("2", ips=("100.64.0.2",))])
+    assert (address_rows, rows_changed) == ([], False)
+    assert events == [("changed", 0, 4, 4)]
+    assert m.index(0, 4).data() == "linux"
+
+
+def test_online_change_updates_whole_row(model):
+    m, events = model
+    m.set_devices([_device("1", online=False), _device("2", ips=("100.64.0.2",))])
+    assert events == [("changed", 0, 0, len(DevicesModel.HEADERS) - 1)]
+    assert m.index(0, 2).data() == "offline"
+    assert m.index(0, 0).data(DevicesModel.IPV4_ROLE) is None  # role tylko dla kolumny adresów
+
+
+def test_address_change_returns_row_and_limits_columns(model):
+    m, events = model
+    address_rows, rows_changed = m.set_devices(
+        [_device("1"), _device("2", ips=("100.64.0.9", "fd7a::9"))]
+    )
+    assert (address_rows, rows_changed) == ([1], False)
+    col = DevicesModel.ADDRESSES_COLUMN
+    assert events == [("changed", 1, col, col)]
+    index = m.index(1, col)
+    assert index.data(DevicesModel.IPV4_ROLE) == ["100.64.0.9"]
+    assert index.data(DevicesModel.IPV6_ROLE) == ["fd7a::9"]
+    assert index.data(DevicesModel.ADDR_TEXT_ROLE) == "100.64.0.9, fd7a::9"
+
+
+def test_duplicate_keys_keep_first_device():
+    m = DevicesModel()
+    address_rows, rows_changed = m.set_devices(
+        [_device("1", name="first"), _device("1", name="second"), _device(None, name="by-name")]
+    )
+    assert rows_changed
+    assert address_rows == [0, 1]
+    assert _names(m) == ["first", "by-name"]
+
+
+@pytest.fixture
+def cache():
+    c = StatusCache()
+    emitted = []
+    for name in ("connectedChanged", "devicesChanged", "selfIpsChanged", "exitNodesChanged"):
+        getattr(c, name).connect(lambda _value, name=name: emitted.append(name))
+    return c, emitted
+
+
+def test_status_cache_first_update_emits_everything(cache):
+    c, emitted = cache
+    c.update(_status([_device("1")]))
+    assert emitted == ["connectedChanged", "devicesChanged", "selfIpsChanged", "exitNodesChanged"]
+
+
+def test_status_cache_emits_only_changed_signals(cache):
+    c, emitted = cache
+    me = _device("0", name="me")
+    c.update(_status([_device("1")], self_device=me))
+    emitted.clear()
+
+    c.update(_status([_device("1")], self_device=me))
+    assert emitted == []
+
+    c.update(_status([_device("1", online=False)], self_device=me))
+    assert emitted == ["devicesChanged"]
+    emitted.clear()
+
+    c.update(_status([_device("1", online=False)], backend_state="Stopped", connected=False, self_device=me))
+    assert emitted == ["connectedChanged"]
+    emitted.clear()
+
+    c.update(_status([_device("1", online=False)], backend_state="Stopped", connected=False,
+                     self_device=_device("0", name="me", ips=("100.64.0.7",))))
+    assert emitted == ["selfIpsChanged"]
+
+
+def test_status_cache_exit_node_change(cache):
+    c, emitted = cache
+    exit_node = _device("1", exit_node_option=True)
+    c.update(_status([exit_node]))
+    emitted.clear()
+    c.update(_status([_device("1", exit_node_option=True, is_exit_node=True)], active_exit_node=exit_node))
+    # Aktywny exit node zmienia też kolumnę "Exit" na liście urządzeń
+    assert emitted == ["devicesChanged", "exitNodesChanged"]
+
+
+def test_status_cache_invalidate_emits_again(cache):
+    c, emitted = cache
+    st = _status([_device("1")])
+    c.update(st)
+    emitted.clear()
+    c.invalidate()
+    c.update(st)
+    assert emitted == ["connectedChanged", "devicesChanged", "selfIpsChanged", "exitNodesChanged"]
@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+
+import pytest
+
+import ip_info
+from ip_info import PublicIPFetcher
+
+
+class _FakeResponse:
+    status_code = 200
+
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+class _FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+_RESPONSES = [
+    {"ip": "1.1.1.1", "org": "AS13335 Cloudflare", "city": "Warsaw", "country": "PL"},
+    {"ip": "2.2.2.2", "org": "AS15169 Google", "city": "Berlin", "country": "DE"},
+]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # Podmieniamy tylko moduł `time` widziany przez ip_info, nie time.monotonic całego procesu
+    clk = _FakeClock()
+    monkeypatch.setattr(ip_info, "time", SimpleNamespace(monotonic=clk))
+    return clk
+
+
+@pytest.fixture
+def fetcher(monkeypatch):
+    f = PublicIPFetcher(ttl=60)
+    calls = []
+
+    def fake_get(url, timeout=None):
+        # Każde wywołanie zwraca kolejną odpowiedź (ostatnia powtarzana)
+        calls.append(url)
+        return _FakeResponse(_RESPONSES[min(len(calls), len(_RESPONSES)) - 1])
+
+    monkeypatch.setattr(f._session, "get", fake_get)
+    return f, calls
+
+
+def test_cache_reused_within_ttl(fetcher, clock):
+    f, calls = fetcher
+    first = f.get_public_ip()
+    clock.now += 59
+    second = f.get_public_ip()
+    assert len(calls) == 1
+    assert second is first
+    assert f.cached() is first
+
+
+def test_cache_expires_after_ttl(fetcher, clock):
+    f, calls = fetcher
+    first = f.get_public_ip()
+    clock.now += 60
+    assert f.cached() is None
+    second = f.get_public_ip()
+    assert len(calls) == 2
+    assert second.ip == "2.2.2.2"
+    assert first.ip == "1.1.1.1"
+
+
+def test_force_bypasses_cache(fetcher, clock):
+    f, calls = fetcher
+    f.get_public_ip()
+    forced = f.get_public_ip(force=True)
+    assert len(calls) == 2
+    assert forced.ip == "2.2.2.2"
+    assert f.cached() is forced
+
+
+def test_details_text_follows_new_fetch(fetcher, clock):
+    f, calls = fetcher
+    first = f.get_public_ip()
+    assert first.details_text == "AS13335 Cloudflare | Warsaw, PL"
+    second = f.get_public_ip(force=True)
+    # Nowe pobranie to nowy obiekt - cached_property nie przenosi starego opisu
+    assert second is not first
+    assert second.details_text == "AS15169 Google | Berlin, DE"
+    assert first.details_text == "AS13335 Cloudflare | Warsaw, PL"